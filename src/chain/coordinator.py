@@ -29,6 +29,9 @@ Examples:
     >>> await coordinator.get_head_subscription_id(1000)
     100
 
+    >>> coordinator.get_head_subscription_id_request(1000)
+    RPCRequest(method="eth_call", params=[...])
+
     >>> await coordinator.get_subscription_by_id(1, 1000)
     Subscription(...)
 
@@ -52,6 +55,7 @@ from enum import Enum
 from functools import cache
 from typing import Any, Iterable, Optional, cast
 
+import structlog
 from eth_abi import encode  # type: ignore
 from eth_account import Account
 from eth_typing import BlockNumber, ChecksumAddress, Hash32, HexStr
@@ -61,14 +65,15 @@ from web3.contract.async_contract import AsyncContractFunction
 from web3.types import Nonce, TxParams
 
 from chain.container_lookup import ContainerLookup
-from chain.rpc import RPC
+from chain.rpc import RPC, RPCRequest
 from shared.subscription import Subscription
 from utils.constants import (
     COORDINATOR_ABI,
     DELEGATED_SIGNER_ABI,
     SUBSCRIPTION_CONSUMER_ABI,
 )
-from utils.logging import log
+
+log = structlog.get_logger(__name__)
 
 
 class CoordinatorEvent(Enum):
@@ -129,6 +134,9 @@ class Coordinator:
         get_deliver_compute_tx: Returns deliverCompute() tx params
         get_deliver_compute_delegatee_tx: Returns deliverComputeDelegatee() tx params
         get_head_subscription_id: Returns latest coordinator subscription ID
+        get_head_subscription_id_request: Returns raw eth_call request collecting
+            latest coordinator subscription ID, for JSON-RPC batching
+        parse_head_subscription_id: Parses raw head subscription ID eth_call result
         get_subscription_by_id: Returns subscription by subscription ID
         get_container_inputs: Returns container inputs by subscription (local or via
             contract)
@@ -369,6 +377,42 @@ class Coordinator:
             await self._contract.functions.id().call(block_identifier=block_number) - 1,
         )
 
+    def get_head_subscription_id_request(
+        self: Coordinator, block_number: BlockNumber
+    ) -> RPCRequest:
+        """Builds raw eth_call request collecting highest subscription ID at block
+        number, for use in JSON-RPC batch calls. Result can be parsed with
+        `parse_head_subscription_id`.
+
+        Args:
+            block_number (BlockNumber): block number to collect at (TOCTTOU)
+
+        Returns:
+            RPCRequest: raw eth_call request
+        """
+        return RPCRequest(
+            "eth_call",
+            [
+                {
+                    "to": self._checksum_address,
+                    "data": self._contract.encodeABI(fn_name="id"),
+                },
+                hex(block_number),
+            ],
+        )
+
+    @staticmethod
+    def parse_head_subscription_id(result: str) -> int:
+        """Parses raw eth_call result of `get_head_subscription_id_request`
+
+        Args:
+            result (str): hex-encoded eth_call return data
+
+        Returns:
+            int: highest subscription ID
+        """
+        return int(result, 16) - 1
+
     async def get_subscription_by_id(
         self: Coordinator, subscription_id: int, block_number: BlockNumber
     ) -> Subscription:
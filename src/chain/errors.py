@@ -1,9 +1,11 @@
 from enum import Enum
 
+import structlog
 from web3.exceptions import ContractCustomError
 
 from shared import Subscription
-from utils.logging import log
+
+log = structlog.get_logger(__name__)
 
 
 class CoordinatorError(Enum):
@@ -11,9 +11,11 @@ forwards them to ChainProcessor.
 from __future__ import annotations
 
 import asyncio
-from asyncio import create_task, sleep
-from typing import cast
+from asyncio import Task, create_task, sleep
+from typing import Iterator, Optional, cast
 
+import structlog
+from aiohttp import ClientResponseError, ContentTypeError
 from eth_typing import BlockNumber
 from reretry import retry  # type: ignore
 
@@ -21,29 +23,30 @@ from chain.coordinator import Coordinator
 from chain.processor import ChainProcessor
 from chain.reader import Reader
 from chain.registry import Registry
-from chain.rpc import RPC
+from chain.rpc import RPC, RPCRequest
 from orchestration.guardian import Guardian
 from shared.config import ConfigSnapshotSync
 from shared.message import GuardianError, SubscriptionCreatedMessage
 from shared.service import AsyncTask
-from utils import log
+
+log = structlog.get_logger(__name__)
 
 SUBSCRIPTION_SYNC_BATCH_SIZE = 20
 
+# Max. number of subscriptions being forwarded to ChainProcessor concurrently
+MAX_IN_FLIGHT_TRACKS = 64
+
 
-def get_batches(start: int, end: int, batch_size: int) -> list[tuple[int, int]]:
+def iter_batches(start: int, end: int, batch_size: int) -> Iterator[tuple[int, int]]:
     """
-    Get batches of size batch_size from start to end (inclusive), used for snapshot sync.
+    Yield batches of size batch_size from start to end (inclusive), used for snapshot
+    sync. Batch bounds are half-open, i.e. (batch_start, batch_end + 1).
     """
     if start == end:
-        return [(start, start + 1)]
-    if end - start + 1 <= batch_size:
-        return [(start, end + 1)]
-    else:
-        return [
-            (i, min(i + batch_size - 1, end) + 1)
-            for i in range(start, end + 1, batch_size)
-        ]
+        yield (start, start + 1)
+        return
+    for i in range(start, end + 1, batch_size):
+        yield (i, min(i + batch_size - 1, end) + 1)
 
 
 class ChainListener(AsyncTask):
@@ -52,12 +55,16 @@ class ChainListener(AsyncTask):
     Public methods:
         setup: Inherited from AsyncTask. Snapshot syncs relevant subscriptions.
         run_forever: Inherited from AsyncTask. Syncs new Coordinator events.
-        cleanup: Inherited from AsyncTask. Unused because process is stateless.
+        cleanup: Inherited from AsyncTask. Waits for in-flight subscription tracking.
 
     Private methods:
         _sync_subscription_creation: Syncs net-new subscriptions
         _snapshot_sync: Called by setup() as well as run_forever() to sync subscriptions.
             Syncs all subscriptions seen till head block.
+        _collect_head: Collects head block, batching a speculative head subscription
+            ID read in the same JSON-RPC request while the chain head is advancing
+        _track: Forwards message to ChainProcessor in a tracked, bounded task
+        _on_track_done: Discards finished track task, logging any exception
 
     Private attributes:
         _rpc (RPC): RPC instance
@@ -71,7 +78,14 @@ class ChainListener(AsyncTask):
         _snapshot_sync_sleep (int): Snapshot sync sleep time between each batch
         _snapshot_sync_batch_size (int): Snapshot sync batch size to sync in parallel
         _snapshot_sync_starting_sub_id (int): Snapshot sync starting subscription ID
+        _snapshot_sync_concurrency (int): Max. number of batches to sync concurrently
         _syncing_period (float): How long to sleep between each iteration
+        _rpc_batching (bool): Whether to use JSON-RPC batching when polling head
+        _last_head_block (Optional[BlockNumber]): Head block seen by the last poll, if
+            it found new blocks. None if it found none (head subscription ID reads
+            are then not speculatively batched)
+        _tracked (set[Task[None]]): In-flight ChainProcessor track tasks
+        _track_semaphore (asyncio.Semaphore): Bounds in-flight ChainProcessor tracks
     """
 
     def __init__(
@@ -111,9 +125,41 @@ class ChainListener(AsyncTask):
         self._snapshot_sync_sleep = snapshot_sync.sleep
         self._snapshot_sync_batch_size = snapshot_sync.batch_size
         self._snapshot_sync_starting_sub_id = snapshot_sync.starting_sub_id
+        self._snapshot_sync_concurrency = snapshot_sync.concurrency
         self._syncing_period = snapshot_sync.sync_period
+        self._rpc_batching = True
+        self._last_head_block: Optional[BlockNumber] = None
+        self._tracked: set[Task[None]] = set()
+        self._track_semaphore = asyncio.Semaphore(MAX_IN_FLIGHT_TRACKS)
         log.info("Initialized ChainListener")
 
+    def _track(self: ChainListener, msg: SubscriptionCreatedMessage) -> None:
+        """Forwards message to ChainProcessor in a background task. Keeps a reference
+        to the task until it completes, and bounds the number of concurrently running
+        tracks.
+
+        Args:
+            msg (SubscriptionCreatedMessage): guardian-filtered message
+        """
+
+        async def _bounded_track() -> None:
+            async with self._track_semaphore:
+                await self._processor.track(msg)
+
+        task = create_task(_bounded_track())
+        self._tracked.add(task)
+        task.add_done_callback(self._on_track_done)
+
+    def _on_track_done(self: ChainListener, task: Task[None]) -> None:
+        """Discards finished track task, logging any exception it raised
+
+        Args:
+            task (Task[None]): finished track task
+        """
+        self._tracked.discard(task)
+        if not task.cancelled() and (e := task.exception()) is not None:
+            log.error("Error tracking subscription", err=e)
+
     async def _sync_batch_subscriptions_creation(
         self: ChainListener,
         start_id: int,
@@ -147,49 +193,56 @@ class ChainListener(AsyncTask):
 
             # Get IDs, intervals and response count data
             # for subscriptions that are on last interval
-            filtered_ids = [sub.id for sub in subscriptions if sub.last_interval]
-            filtered_intervals = [
-                sub.interval for sub in subscriptions if sub.last_interval
-            ]
-            filtered_subscriptions_response_count = (
-                await self._reader.read_redundancy_count_batch(
-                    filtered_ids, filtered_intervals, block_number
+            filtered_ids: list[int] = []
+            filtered_intervals: list[int] = []
+            for sub in subscriptions:
+                if sub.last_interval:
+                    filtered_ids.append(sub.id)
+                    filtered_intervals.append(sub.interval)
+
+            # Skip redundancy count read if no subscription is on its last interval
+            if filtered_ids:
+                filtered_subscriptions_response_count = (
+                    await self._reader.read_redundancy_count_batch(
+                        filtered_ids, filtered_intervals, block_number
+                    )
                 )
-            )
 
-            assert (
-                len(filtered_ids)
-                == len(filtered_intervals)
-                == len(filtered_subscriptions_response_count)
-            ), "Arrays must have the same length"
-
-            for i in range(len(filtered_ids)):
-                sub_id = filtered_ids[i]
-                interval = filtered_intervals[i]
-                response_count = filtered_subscriptions_response_count[i]
-
-                # Find the corresponding subscription in the subscriptions list
-                for subscription in subscriptions:
-                    if subscription.id == sub_id:
-                        subscription.set_response_count(interval, response_count)
-                        # Create new subscription created message
-
-            for subscription in subscriptions:
-                msg = SubscriptionCreatedMessage(subscription)
+                assert (
+                    len(filtered_ids)
+                    == len(filtered_intervals)
+                    == len(filtered_subscriptions_response_count)
+                ), "Arrays must have the same length"
+
+                # Index subscriptions by ID for constant-time lookup
+                subscriptions_by_id = {sub.id: sub for sub in subscriptions}
+
+                for sub_id, interval, response_count in zip(
+                    filtered_ids,
+                    filtered_intervals,
+                    filtered_subscriptions_response_count,
+                ):
+                    subscriptions_by_id[sub_id].set_response_count(
+                        interval, response_count
+                    )
 
-                # Run message through guardian
-                filtered = self._guardian.process_message(msg)
+            # Run messages through guardian, off the event loop
+            msgs = [SubscriptionCreatedMessage(sub) for sub in subscriptions]
+            filtered_msgs = await asyncio.to_thread(
+                self._guardian.process_messages, msgs
+            )
 
+            for subscription, msg, filtered in zip(subscriptions, msgs, filtered_msgs):
                 if isinstance(filtered, GuardianError):
                     # If filtered out by guardian, message is irrelevant
                     log.info(
                         "Ignored subscription creation",
-                        id=sub_id,
+                        id=subscription.id,
                         err=filtered.error,
                     )
                 else:
                     # Pass filtered message to ChainProcessor
-                    create_task(self._processor.track(msg))
+                    self._track(msg)
                     log.info("Relayed subscription creation", id=subscription.id)
             break
         return
@@ -222,13 +275,16 @@ class ChainListener(AsyncTask):
         # sleeps self._snapshot_sync_sleep seconds between each batch
         start = self._last_subscription_id + 1
 
-        batches = get_batches(start, head_sub_id, self._snapshot_sync_batch_size)
-
-        if len(batches) == 1 and batches[0][0] == batches[0][1]:
+        if start > head_sub_id:
             # no new subscriptions to sync
             return
 
-        log.info("Syncing new subscriptions", batches=batches)
+        log.info(
+            "Syncing new subscriptions",
+            start=start,
+            end=head_sub_id,
+            batch_size=self._snapshot_sync_batch_size,
+        )
 
         @retry(delay=self._snapshot_sync_sleep, backoff=2)  # type: ignore
         async def _sync_subscription_batch_with_retry(batch: tuple[int, int]) -> None:
@@ -246,12 +302,30 @@ class ChainListener(AsyncTask):
                 )
                 raise e
 
-        for _batch in batches:
-            # sync for this batch
-            await _sync_subscription_batch_with_retry(_batch)
-
-            # sleep between batches to avoid getting rate-limited by the RPC
-            await asyncio.sleep(self._snapshot_sync_sleep)
+        # Batches are pulled lazily from a shared iterator by a bounded number of
+        # workers, so RPC reads of one batch overlap with processing of another
+        # without flooding the RPC
+        batches = iter_batches(start, head_sub_id, self._snapshot_sync_batch_size)
+
+        async def _sync_subscription_batches_worker() -> None:
+            """Sync subscription batches until the shared iterator is exhausted"""
+            for batch in batches:
+                # sync for this batch
+                await _sync_subscription_batch_with_retry(batch)
+
+                # sleep between batches to avoid getting rate-limited by the RPC
+                await asyncio.sleep(self._snapshot_sync_sleep)
+
+        try:
+            await asyncio.gather(
+                *[
+                    _sync_subscription_batches_worker()
+                    for _ in range(self._snapshot_sync_concurrency)
+                ]
+            )
+        finally:
+            # Cached reads are keyed by this sync's head block, don't keep them alive
+            self._reader.clear_subscription_batch_cache()
 
     async def setup(self: ChainListener) -> None:
         """ChainListener startup
@@ -284,11 +358,89 @@ class ChainListener(AsyncTask):
 
         log.info("Finished snapshot sync", new_head=head_block)
 
+    async def _collect_head(
+        self: ChainListener,
+    ) -> tuple[BlockNumber, Optional[tuple[BlockNumber, int]]]:
+        """Collects head block number, trailing by _trail_head_blocks.
+
+        If the last poll found new blocks and the RPC supports JSON-RPC batching,
+        speculatively collects the head subscription ID at the next target block in the
+        same round trip. Idle polls only collect the head block. In practice this only
+        batches while catching up on a backlog: once synced, blocks arrive slower than
+        the polling period, so most polls follow an idle one and read sequentially.
+        Batch requests go through `RPC.batch_call`'s own HTTP session, not the web3
+        provider, so provider request settings do not apply to them.
+
+        Falls back to sequential requests for the listener lifetime if the RPC rejects
+        batch requests, or for the current poll on other errors and malformed results.
+
+        Returns:
+            tuple[BlockNumber, Optional[tuple[BlockNumber, int]]]: head block, and
+                (target block, head subscription ID at target block) if collected
+        """
+        # Typed locals instead of `cast` calls, this runs on every poll
+        head_block: BlockNumber
+
+        if self._rpc_batching and self._last_head_block is not None:
+            # Target block if the head has not advanced since the last poll, or the
+            # next block if the listener caught up with it
+            next_block: BlockNumber = self._last_block + min(  # type: ignore[assignment]
+                max(self._last_head_block - self._last_block, 1), 100
+            )
+            try:
+                block_number, head_sub_id = await self._rpc.batch_call(
+                    [
+                        RPCRequest("eth_blockNumber", []),
+                        self._coordinator.get_head_subscription_id_request(next_block),
+                    ]
+                )
+            except Exception as e:
+                # Only stop batching if the RPC rejects batch requests, not on
+                # transient errors (e.g. timeouts, 5xx)
+                rejected = isinstance(e, (ValueError, ContentTypeError)) or (
+                    isinstance(e, ClientResponseError) and 400 <= e.status < 500
+                )
+                log.warning(
+                    "JSON-RPC batch request failed, falling back to sequential requests",
+                    err=str(e),
+                    batching_disabled=rejected,
+                )
+                if rejected:
+                    self._rpc_batching = False
+            else:
+                # Parsed outside the handler above: a malformed result (e.g. "0x")
+                # falls back to sequential requests for this poll only
+                try:
+                    if block_number is not None:
+                        head_block = (
+                            int(block_number, 16)  # type: ignore[assignment]
+                            - self._trail_head_blocks
+                        )
+                        if head_sub_id is None:
+                            return head_block, None
+                        return (
+                            head_block,
+                            (
+                                next_block,
+                                Coordinator.parse_head_subscription_id(head_sub_id),
+                            ),
+                        )
+                except ValueError as e:
+                    log.debug("Malformed JSON-RPC batch result", err=str(e))
+
+        head_block = (
+            await self._rpc.get_head_block_number()  # type: ignore[assignment]
+            - self._trail_head_blocks
+        )
+        return head_block, None
+
     async def run_forever(self: ChainListener) -> None:
         """Core ChainListener event loop
 
         Process:
-            1. Collects chain head block and latest locally synced block
+            1. Collects chain head block and latest locally synced block (batched with
+                head subscription ID at the next target block, if the head is
+                advancing and RPC supports batching)
             2. If head > locally_synced:
                 2.1. Collects coordinator subscription creations (locally_synced, head)
                     2.1.1. Up to a maximum of 100 blocks to not overload RPC
@@ -299,24 +451,26 @@ class ChainListener(AsyncTask):
         log.info("Started ChainListener lifecycle", last_synced=self._last_block)
 
         while not self._shutdown:
-            # Collect chain head block
-            head_block = cast(
-                BlockNumber,
-                (
-                    cast(int, await self._rpc.get_head_block_number())
-                    - self._trail_head_blocks
-                ),
-            )
+            # Collect chain head block (and, if batched, head subscription ID at the
+            # next target block)
+            head_block, collected = await self._collect_head()
 
             # Check if latest locally synced block < chain head block
             if self._last_block < head_block:
                 # Setup number of blocks to sync
                 num_blocks_to_sync = min(head_block - self._last_block, 100)
                 # Setup target block (last + diff inclusive)
-                target_block = cast(BlockNumber, self._last_block + num_blocks_to_sync)
-                head_sub_id = await self._coordinator.get_head_subscription_id(
-                    target_block
+                target_block: BlockNumber = (
+                    self._last_block + num_blocks_to_sync  # type: ignore[assignment]
                 )
+                if collected is not None and collected[0] <= target_block:
+                    # Already collected in the same round trip as head block. Sync up
+                    # to its (possibly earlier) target block, the rest is synced next
+                    target_block, head_sub_id = collected
+                else:
+                    head_sub_id = await self._coordinator.get_head_subscription_id(
+                        target_block
+                    )
                 log.info(f"head sub id is: {head_sub_id}")
                 num_subs_to_sync = min(
                     head_sub_id - self._last_subscription_id,
@@ -337,6 +491,7 @@ class ChainListener(AsyncTask):
 
                 # Update last synced block
                 self._last_block = target_block
+                self._last_head_block = head_block
                 self._last_subscription_id = head_sub_id
 
                 log.info(
@@ -347,10 +502,10 @@ class ChainListener(AsyncTask):
                 )
             else:
                 # Else, if already synced to head, sleep
+                self._last_head_block = None
                 log.debug(
-                    "No new blocks, sleeping for: ",
-                    self._syncing_period,
-                    "seconds",
+                    "No new blocks, sleeping",
+                    sleep=self._syncing_period,
                     head=head_block,
                     synced=self._last_block,
                     behind=self._trail_head_blocks,
@@ -358,5 +513,5 @@ class ChainListener(AsyncTask):
                 await sleep(self._syncing_period)
 
     async def cleanup(self: ChainListener) -> None:
-        """Stateless task, no cleanup necessary"""
-        pass
+        """Waits for in-flight subscription tracking to finish"""
+        await asyncio.gather(*self._tracked, return_exceptions=True)
@@ -0,0 +1,97 @@
+"""Multicall3
+
+Off-chain interface to the Multicall3 contract, used to aggregate multiple read-only
+contract calls into a single eth_call.
+
+Examples:
+    >>> rpc = RPC("https://my_rpc_url.com")
+    >>> multicall = Multicall(rpc)
+
+    >>> await multicall.is_deployed()
+    True
+
+    >>> await multicall.aggregate3([(address, call_data), ...], block_number)
+    [b"...", ...]
+"""
+
+from __future__ import annotations
+
+from typing import Optional, cast
+
+import structlog
+from eth_typing import BlockNumber, ChecksumAddress, HexStr
+
+from chain.rpc import RPC
+from utils.constants import MULTICALL3_ABI, MULTICALL3_ADDRESS
+
+log = structlog.get_logger(__name__)
+
+
+class Multicall:
+    """Off-chain interface to Multicall3
+
+    Public methods:
+        is_deployed: Returns whether Multicall3 is deployed on the connected chain
+        aggregate3: Executes calls in a single eth_call, returns raw return data
+
+    Private attributes:
+        _rpc (RPC): RPC instance
+        _address (ChecksumAddress): Multicall3 contract address
+        _contract (AsyncContract): Multicall3 AsyncContract instance
+        _deployed (Optional[bool]): Cached deployment status, None if not yet checked
+    """
+
+    def __init__(self: Multicall, rpc: RPC, address: str = MULTICALL3_ADDRESS) -> None:
+        """Initializes new Multicall
+
+        Args:
+            rpc (RPC): RPC instance
+            address (str): Multicall3 contract address. Defaults to the canonical
+                Multicall3 deployment address.
+
+        Raises:
+            ValueError: Multicall3 address is incorrectly formatted
+        """
+
+        if not rpc.is_valid_address(address):
+            raise ValueError("Multicall3 address is incorrectly formatted")
+
+        self._rpc = rpc
+        self._address = rpc.get_checksum_address(address)
+        self._contract = rpc.get_contract(address=self._address, abi=MULTICALL3_ABI)
+        self._deployed: Optional[bool] = None
+        log.debug("Initialized Multicall", address=self._address)
+
+    async def is_deployed(self: Multicall) -> bool:
+        """Returns whether Multicall3 is deployed on the connected chain. Result is
+        cached after the first successful check.
+
+        Returns:
+            bool: True if contract code exists at the Multicall3 address, else False
+        """
+        if self._deployed is None:
+            code = await self._rpc.web3.eth.get_code(self._address)
+            self._deployed = len(code) > 0
+            if not self._deployed:
+                log.info("Multicall3 not deployed, aggregation disabled")
+        return self._deployed
+
+    async def aggregate3(
+        self: Multicall,
+        calls: list[tuple[ChecksumAddress, HexStr]],
+        block_number: BlockNumber,
+    ) -> list[bytes]:
+        """Executes calls in a single eth_call at the specified block number. Any
+        failing call reverts the whole aggregate.
+
+        Args:
+            calls (list[tuple[ChecksumAddress, HexStr]]): (target, calldata) pairs
+            block_number (BlockNumber): block number to query at
+
+        Returns:
+            list[bytes]: raw return data, one entry per call
+        """
+        results = await self._contract.functions.aggregate3(
+            [(target, False, call_data) for target, call_data in calls]
+        ).call(block_identifier=block_number)
+        return [cast(bytes, return_data) for _, return_data in results]
@@ -10,7 +10,7 @@ from web3.contract.async_contract import AsyncContract
 from chain.rpc import RPC
 from utils.constants import PAYMENT_WALLET_ABI
 
-log = structlog.get_logger()
+log = structlog.get_logger(__name__)
 
 
 class PaymentWallet:
@@ -11,6 +11,7 @@ from asyncio import create_task, sleep
 from copy import deepcopy
 from typing import Any, Optional, Tuple, cast
 
+import structlog
 from eth_abi import encode  # type: ignore
 from eth_typing import HexStr
 from web3.exceptions import ContractCustomError, ContractLogicError
@@ -33,7 +34,8 @@ from shared.message import (
 )
 from shared.service import AsyncTask
 from shared.subscription import Subscription
-from utils.logging import log
+
+log = structlog.get_logger(__name__)
 
 # Blocked tx
 BLOCKED: HexStr = cast(HexStr, "0xblocked")
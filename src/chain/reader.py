@@ -4,22 +4,37 @@ Off-chain interface to the Reader Contract.
 
 Examples:
     >>> rpc = RPC("https://my_rpc_url.com")
-    >>> reader = Reader(rpc, "0x...", container_lookup=container_lookup)
+    >>> reader = Reader(
+            rpc, "0x...", container_lookup=container_lookup, multicall=multicall
+        )
     >>> reader.read_subscription_batch(start_id, end_id, block_number)
     >>> reader.read_redundancy_count_batch(ids, intervals, block_number)
 """
 
 from __future__ import annotations
 
-from typing import List, cast
+import asyncio
+from collections import OrderedDict
+from typing import Any, List, Optional, cast
 
+import structlog
 from eth_typing import BlockNumber
 
 from chain.container_lookup import ContainerLookup
+from chain.multicall import Multicall
 from chain.rpc import RPC
 from shared.subscription import Subscription
 from utils.constants import READER_ABI
-from utils.logging import log
+
+log = structlog.get_logger(__name__)
+
+# Max. number of (block number, start ID, end ID) subscription batch reads to cache.
+# Entries are only reused by retries of in-flight batches, so this stays small
+SUBSCRIPTION_BATCH_CACHE_SIZE = 16
+
+# Time to wait for concurrent redundancy count reads at the same block to queue up
+# before aggregating them into one Multicall3 call, in seconds
+REDUNDANCY_BATCH_WINDOW = 0.05
 
 
 class Reader:
@@ -30,11 +45,28 @@ class Reader:
         read_subscription_batch: Returns Subscriptions from Coordinator in batch
             from start_id to end_id
         read_redundancy_count_batch: Given Subscription ids and intervals
-            return redundancy count of (subscription, interval)-pair
+            return redundancy count of (subscription, interval)-pair. Concurrent
+            reads at the same block are aggregated through Multicall3 if available
+        clear_subscription_batch_cache: Drops cached subscription batch reads
+
+    Private methods:
+        _flush_redundancy_count_batches: Reads all pending redundancy count batches
+            for a block number in a single Multicall3 eth_call
 
     Private attributes:
         _rpc (RPC): RPC instance
         _contract (AsyncContract): Reader AsyncContract instance
+        _fn_read_sub_batch (AsyncContractFunction): Cached readSubscriptionBatch
+            function builder
+        _fn_read_redundancy (AsyncContractFunction): Cached readRedundancyCountBatch
+            function builder
+        _multicall (Optional[Multicall]): Multicall instance, None to disable
+            aggregation
+        _pending_redundancy (dict[BlockNumber, list[tuple[List[int], List[int],
+            asyncio.Future[List[int]]]]]): Pending redundancy count reads by block
+        _flushes (set[asyncio.Task[None]]): Running redundancy count flush tasks
+        _sub_batch_cache (OrderedDict[tuple[int, int, int], list[Any]]): LRU cache
+            of raw subscription batch rows, keyed by (block number, start ID, end ID)
     """
 
     def __init__(
@@ -42,6 +74,7 @@ class Reader:
         rpc: RPC,
         reader_address: str,
         container_lookup: ContainerLookup,
+        multicall: Optional[Multicall] = None,
     ) -> None:
         """Initializes new Reader
 
@@ -49,6 +82,8 @@ class Reader:
             rpc (RPC): RPC instance
             reader_address (str): Reader contract address
             container_lookup (ContainerLookup): ContainerLookup instance
+            multicall (Optional[Multicall]): Multicall instance, used to aggregate
+                concurrent redundancy count reads. Defaults to None (disabled).
         Raises:
             ValueError: Reader address is incorrectly formatted
         """
@@ -66,6 +101,21 @@ class Reader:
             address=self._checksum_address,
             abi=READER_ABI,
         )
+
+        # Cache contract function builders, avoids ABI resolution on every batch read
+        self._fn_read_sub_batch = self._contract.functions.readSubscriptionBatch
+        self._fn_read_redundancy = self._contract.functions.readRedundancyCountBatch
+
+        self._multicall = multicall
+        self._pending_redundancy: dict[
+            BlockNumber,
+            list[tuple[List[int], List[int], asyncio.Future[List[int]]]],
+        ] = {}
+        self._flushes: set[asyncio.Task[None]] = set()
+
+        self._sub_batch_cache: OrderedDict[tuple[int, int, int], list[Any]] = (
+            OrderedDict()
+        )
         log.debug("Initialized Reader", address=self._checksum_address)
 
     async def read_subscription_batch(
@@ -73,6 +123,11 @@ class Reader:
     ) -> List[Subscription]:
         """Reads Subscriptions from Coordinator in batch
 
+        Raw subscription rows are cached per (block number, start ID, end ID), since
+        subscriptions read at a fixed (trailing) block do not change, so that retried
+        batches are not re-read. The cache is cleared after each snapshot sync. Fresh
+        Subscription objects are built on every call, as they hold mutable state.
+
         Args:
             start_id (int): starting id of batch
             end_id (int): last id of batch
@@ -81,17 +136,29 @@ class Reader:
             List[Subscription]: Subscriptions object list
         """
 
-        subscriptions_data = await self._contract.functions.readSubscriptionBatch(
-            start_id, end_id
-        ).call(block_identifier=block_number)
-        subscriptions = []
-        for i, sub in enumerate(subscriptions_data):
-            subscription_id = (
-                start_id + i
-            )  # Assuming IDs are in increasing order starting from start_id
-            subscription = Subscription(subscription_id, self._lookup, *sub)
-            subscriptions.append(subscription)
-        return subscriptions
+        key = (int(block_number), start_id, end_id)
+        subscriptions_data = self._sub_batch_cache.get(key)
+        if subscriptions_data is None:
+            subscriptions_data = await self._fn_read_sub_batch(start_id, end_id).call(
+                block_identifier=block_number
+            )
+            self._sub_batch_cache[key] = subscriptions_data
+            if len(self._sub_batch_cache) > SUBSCRIPTION_BATCH_CACHE_SIZE:
+                self._sub_batch_cache.popitem(last=False)
+        else:
+            self._sub_batch_cache.move_to_end(key)
+
+        # Subscription IDs are consecutive, starting from start_id
+        return Subscription.from_reader_tuples(
+            start_id, self._lookup, subscriptions_data
+        )
+
+    def clear_subscription_batch_cache(self: Reader) -> None:
+        """Drops cached subscription batch reads. Called once a snapshot sync is done,
+        as cache keys include the (head) block number read at, so entries are only
+        reused by retries within the same sync.
+        """
+        self._sub_batch_cache.clear()
 
     async def read_redundancy_count_batch(
         self: Reader, ids: List[int], intervals: List[int], block_number: BlockNumber
@@ -99,16 +166,100 @@ class Reader:
         """Given Subscription ids and intervals,
             collects redundancy count of (subscription, interval)-pair
 
+        If Multicall3 is enabled, reads issued for the same block number within
+        REDUNDANCY_BATCH_WINDOW (e.g. from parallel snapshot sync batches) are
+        aggregated into one eth_call.
+
         Args:
             ids (List[int]): Subscription ids
             intervals (List[int]): intervals
+            block_number(BlockNumber): the block number to query at
 
         Returns:
             count(List[int]): redundancy count list
         """
-        return cast(
-            List[int],
-            await self._contract.functions.readRedundancyCountBatch(
-                ids, intervals
-            ).call(block_identifier=block_number),
-        )
+        if self._multicall is None or not await self._multicall.is_deployed():
+            return cast(
+                List[int],
+                await self._fn_read_redundancy(ids, intervals).call(
+                    block_identifier=block_number
+                ),
+            )
+
+        future: asyncio.Future[List[int]] = asyncio.get_running_loop().create_future()
+        pending = self._pending_redundancy.get(block_number)
+        if pending is None:
+            # First read queued for this block schedules a flush of all reads queued
+            # alongside it. Flushing runs in its own task, so cancelling a reader
+            # does not leave other queued reads hanging
+            pending = self._pending_redundancy[block_number] = []
+            task = asyncio.create_task(
+                self._flush_redundancy_count_batches(block_number)
+            )
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+        pending.append((ids, intervals, future))
+
+        return await future
+
+    async def _flush_redundancy_count_batches(
+        self: Reader, block_number: BlockNumber
+    ) -> None:
+        """Reads all pending redundancy count batches for a block number through a
+        single Multicall3 aggregate3 call, resolving each pending read's future
+
+        Args:
+            block_number(BlockNumber): the block number to query at
+        """
+
+        pending = self._pending_redundancy[block_number]
+        try:
+            # Wait for concurrently running batches to queue their reads
+            await asyncio.sleep(REDUNDANCY_BATCH_WINDOW)
+            # Reads queued from here on start a new batch
+            del self._pending_redundancy[block_number]
+
+            if len(pending) == 1:
+                ids, intervals, future = pending[0]
+                counts = await self._fn_read_redundancy(ids, intervals).call(
+                    block_identifier=block_number
+                )
+                if not future.done():
+                    future.set_result(counts)
+                return
+
+            return_data = await cast(Multicall, self._multicall).aggregate3(
+                [
+                    (
+                        self._checksum_address,
+                        self._contract.encodeABI(
+                            fn_name="readRedundancyCountBatch", args=[ids, intervals]
+                        ),
+                    )
+                    for ids, intervals, _ in pending
+                ],
+                block_number,
+            )
+            log.debug(
+                "Aggregated redundancy count reads",
+                count=len(pending),
+                block_number=block_number,
+            )
+            for (_, _, future), data in zip(pending, return_data):
+                # Reader may have been cancelled in the meantime
+                if not future.done():
+                    future.set_result(
+                        list(self._rpc.web3.codec.decode(["uint16[]"], data)[0])
+                    )
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # If flush was cancelled (including during the batching window), don't
+            # leave queued reads hanging
+            if self._pending_redundancy.get(block_number) is pending:
+                del self._pending_redundancy[block_number]
+            for _, _, future in pending:
+                if not future.done():
+                    future.cancel()
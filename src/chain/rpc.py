@@ -43,15 +43,21 @@ Examples:
 
     >>> await rpc.send_transaction(SignedTransaction(...))
     0x6d0fda2e2168959f04ca777e66cf4b29cfebc53c0a071a0b7b559ea6c345d093
+
+    >>> await rpc.batch_call([RPCRequest("eth_blockNumber", []), ...])
+    ["0x3e8", ...]
 """
 
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
 from functools import cache
 from typing import Any, Optional, Sequence, cast
 
+import structlog
 import validators  # type: ignore
+from aiohttp import ClientSession, ClientTimeout
 from async_lru import alru_cache
 from eth_account.datastructures import SignedTransaction
 from eth_typing import BlockNumber, ChecksumAddress, HexStr
@@ -61,7 +67,15 @@ from web3.exceptions import TransactionNotFound
 from web3.middleware.signing import async_construct_sign_and_send_raw_middleware
 from web3.types import ABIElement, BlockData, FilterParams, LogReceipt, Nonce
 
-from utils.logging import log
+log = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RPCRequest:
+    """Raw JSON-RPC request, used in batch calls"""
+
+    method: str
+    params: list[Any]
 
 
 class RPC:
@@ -81,11 +95,14 @@ class RPC:
         get_tx_success: Returns whether a tx was successfully processed on-chain
         get_event_logs: Returns event logs via eth_newFilter + eth_getFilterChanges
         send_transaction: Sends signed transaction
+        batch_call: Sends multiple raw requests in a single JSON-RPC batch
+        close: Closes HTTP session used for batch calls
 
     Private attributes:
         _web3 (AsyncWeb3): Async web3.py client
         _rpc_url (str): HTTP(s) RPC URL
         _private_key (str): private key
+        _session (Optional[ClientSession]): HTTP session used for batch calls
 
     """
 
@@ -107,6 +124,7 @@ class RPC:
         self._rpc_url = rpc_url
         self._private_key = private_key
         self._web3: Optional[AsyncWeb3] = None
+        self._session: Optional[ClientSession] = None
 
     async def initialize(self: RPC) -> RPC:
         # Setup new Web3 HTTP provider w/ 10 minute timeout
@@ -327,3 +345,44 @@ class RPC:
         except Exception as e:
             log.debug("rpc.send_transaction failed", error=str(e))
             raise
+
+    async def batch_call(self: RPC, requests: list[RPCRequest]) -> list[Any]:
+        """Sends multiple raw requests in a single JSON-RPC 2.0 batch (one HTTP round
+        trip). Results are returned in request order.
+
+        Args:
+            requests (list[RPCRequest]): raw JSON-RPC requests
+
+        Returns:
+            list[Any]: raw result per request, None for requests that errored
+
+        Raises:
+            ValueError: RPC provider does not support batch requests
+        """
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(timeout=ClientTimeout(total=60))
+
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": r.method, "params": r.params}
+            for i, r in enumerate(requests)
+        ]
+        async with self._session.post(self._rpc_url, json=payload) as response:
+            response.raise_for_status()
+            body = await response.json()
+
+        # Providers that don't support batching respond with a single error object
+        if not isinstance(body, list):
+            raise ValueError(f"RPC batch request rejected: {body}")
+
+        results: list[Any] = [None] * len(requests)
+        for item in body:
+            if "error" in item:
+                log.debug("rpc.batch_call request failed", error=item["error"])
+                continue
+            results[item["id"]] = item.get("result")
+        return results
+
+    async def close(self: RPC) -> None:
+        """Closes HTTP session used for batch calls"""
+        if self._session is not None:
+            await self._session.close()
@@ -8,6 +8,7 @@ from __future__ import annotations
 import asyncio
 from typing import Optional, cast
 
+import structlog
 from eth_account import Account
 from eth_typing import ChecksumAddress
 from reretry import retry  # type: ignore
@@ -23,7 +24,8 @@ from chain.errors import raise_if_infernet_error
 from chain.rpc import RPC
 from shared.subscription import Subscription
 from utils.constants import ZERO_ADDRESS
-from utils.logging import log
+
+log = structlog.get_logger(__name__)
 
 
 class Wallet:
@@ -10,6 +10,7 @@ from web3 import Web3
 from chain.container_lookup import ContainerLookup
 from chain.coordinator import Coordinator
 from chain.listener import ChainListener
+from chain.multicall import Multicall
 from chain.payment_wallet import PaymentWallet
 from chain.processor import ChainProcessor
 from chain.reader import Reader
@@ -33,6 +34,8 @@ class NodeLifecycle:
         _tasks (list[AsyncTask]): List of initialized tasks
         _asyncio_tasks (list[asyncio.Task[Any]]): List of `run_forever` asyncio tasks
         _stat_sender (Optional[StatSender]): StatSender instance
+        _orchestrator (Optional[Orchestrator]): Orchestrator instance
+        _rpc (Optional[RPC]): RPC instance, if chain is enabled
 
     Public Methods:
         on_startup: Node initialization and setup
@@ -50,6 +53,8 @@ class NodeLifecycle:
         self._tasks: list[AsyncTask] = []
         self._asyncio_tasks: list[asyncio.Task[Any]] = []
         self._stat_sender: Optional[StatSender] = None
+        self._orchestrator: Optional[Orchestrator] = None
+        self._rpc: Optional[RPC] = None
 
     def on_startup(self: NodeLifecycle) -> None:
         """Node startup
@@ -90,6 +95,7 @@ class NodeLifecycle:
 
         # Initialize orchestrator
         orchestrator = Orchestrator(manager, store)
+        self._orchestrator = orchestrator
 
         # Initialize container lookup
         container_lookup = ContainerLookup(container_configs)
@@ -109,6 +115,7 @@ class NodeLifecycle:
             # Ensure prefix is added to private key
             private_key = f"0x{private_key.removeprefix('0x')}"
             rpc = RPC(rcp_url, private_key)
+            self._rpc = rpc
 
             asyncio.get_event_loop().run_until_complete(rpc.initialize())
             chain_id = asyncio.get_event_loop().run_until_complete(rpc.get_chain_id())
@@ -153,6 +160,7 @@ class NodeLifecycle:
                 rpc,
                 registry.reader,
                 container_lookup=container_lookup,
+                multicall=Multicall(rpc),
             )
 
             wallet = Wallet(
@@ -279,6 +287,14 @@ class NodeLifecycle:
         # Cleanup all tasks
         await asyncio.gather(*(task.cleanup() for task in self._tasks))
 
+        # Close orchestrator's shared container HTTP session
+        if self._orchestrator:
+            await self._orchestrator.close()
+
+        # Close RPC's JSON-RPC batch HTTP session
+        if self._rpc:
+            await self._rpc.close()
+
         log.debug("Shutdown complete.")
 
     def lifecycle_main(self: NodeLifecycle) -> None:
@@ -35,6 +35,7 @@ from __future__ import annotations
 from asyncio import gather, get_event_loop, sleep
 from typing import Any, Optional
 
+import structlog
 from docker import from_env  # type: ignore
 from docker.errors import NotFound  # type: ignore
 from docker.models.containers import Container  # type: ignore
@@ -42,9 +43,10 @@ from docker.types import DeviceRequest  # type: ignore
 
 from shared import AsyncTask
 from shared.config import ConfigDocker, InfernetContainer
-from utils import log
 from utils.logging import log_ascii_status
 
+log = structlog.get_logger(__name__)
+
 DEFAULT_STARTUP_WAIT: float = 60.0
 
 
@@ -65,6 +67,7 @@ class ContainerManager(AsyncTask):
         port_mappings (dict[str, int]): Port mappings for containers. Does NOT
             guarantee containers are running.
         running_containers (list[str]): List of running containers (by ID).
+        configs (list[InfernetContainer]): Container configurations.
 
     Private attributes:
         _configs (list[InfernetContainer]): Container configurations to run.
@@ -131,6 +134,11 @@ class ContainerManager(AsyncTask):
         """Port mappings for containers. Does NOT guarantee containers are running"""
         return self._port_mappings
 
+    @property
+    def configs(self: ContainerManager) -> list[InfernetContainer]:
+        """Container configurations"""
+        return self._configs
+
     @property
     def running_containers(self: ContainerManager) -> list[str]:
         """Get list of running container IDs"""
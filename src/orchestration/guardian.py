@@ -3,7 +3,9 @@ from __future__ import annotations
 import time
 from dataclasses import asdict, dataclass
 from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
-from typing import Any, Optional, Union, cast
+from typing import Any, Optional, Sequence, Union, cast
+
+import structlog
 
 from chain.container_lookup import ContainerLookup
 from chain.wallet_checker import WalletChecker
@@ -17,7 +19,8 @@ from shared.message import (
     PrefilterMessage,
     SubscriptionCreatedMessage,
 )
-from utils.logging import log
+
+log = structlog.get_logger(__name__)
 
 
 @dataclass(frozen=True)
@@ -51,6 +54,7 @@ class Guardian:
 
     Methods:
         process_message: Parses and filters message
+        process_messages: Parses and filters a batch of messages
         wallet_checker: Wallet checker getter, unpacks the optional _wallet_checker
 
     Private Methods:
@@ -461,3 +465,18 @@ class Guardian:
                     cast(SubscriptionCreatedMessage, message)
                 )
         return self._error(message, "Not supported", raw=message)
+
+    def process_messages(
+        self: Guardian, messages: Sequence[PrefilterMessage]
+    ) -> list[Union[GuardianError, FilteredMessage]]:
+        """Public method to parse and filter a batch of messages. Does not touch the
+        event loop, so it can be run off-thread (e.g. via `asyncio.to_thread`).
+
+        Args:
+            messages (Sequence[PrefilterMessage]): Messages to filter
+
+        Returns:
+            list[Union[GuardianError, FilteredMessage]]: Error message or filtered
+                message, one per input message (in order)
+        """
+        return [self.process_message(message) for message in messages]
@@ -1,21 +1,87 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import asdict
-from json import JSONDecodeError
+import json
 from os import environ
 from typing import Any, AsyncGenerator, Optional, cast
 
-from aiohttp import ClientSession, ClientTimeout
+import structlog
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
 from shared import ContainerError, ContainerOutput, ContainerResult
 from shared.job import ContainerInput, JobInput, JobLocation
 from shared.message import OffchainJobMessage
-from utils import log
 
 from .docker import ContainerManager
 from .store import DataStore
 
+log = structlog.get_logger(__name__)
+
+# Per-container timeout (in seconds) when collecting service resources
+SERVICE_RESOURCES_TIMEOUT = 5
+
+# Max. number of containers queried concurrently when collecting service resources
+SERVICE_RESOURCES_MAX_CONCURRENCY = 16
+
+# Rough payload size (in bytes) above which serialization is moved off the event loop
+OFFLOAD_SERIALIZATION_THRESHOLD = 64_000
+
+
+def _json_dumps(payload: dict[str, Any]) -> bytes:
+    """Serializes request payload to JSON bytes
+
+    Uses the standard library encoder, matching aiohttp's `json=` serialization byte
+    for byte (orjson would turn NaN and Infinity in chained container outputs into
+    null).
+
+    Args:
+        payload (dict[str, Any]): request payload
+
+    Returns:
+        bytes: JSON-encoded payload
+    """
+    return json.dumps(payload).encode()
+
+
+def _rough_size(data: Any, depth: int = 2) -> int:
+    """Cheap estimate of a payload's serialized size in bytes. Only walks the first
+    `depth` levels of nested containers, deeper containers and scalars are counted
+    at a fixed size per element.
+
+    Args:
+        data (Any): payload
+        depth (int): number of nested container levels to walk
+
+    Returns:
+        int: estimated size in bytes
+    """
+    if isinstance(data, (str, bytes)):
+        return len(data)
+    if isinstance(data, dict):
+        if depth == 0:
+            return 8 * len(data)
+        return sum(_rough_size(value, depth - 1) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        if depth == 0:
+            return 8 * len(data)
+        return sum(_rough_size(value, depth - 1) for value in data)
+    return 8
+
+
+async def _serialize(payload: dict[str, Any]) -> bytes:
+    """Serializes request payload to JSON bytes, in a worker thread if the payload's
+    data is large enough to block the event loop
+
+    Args:
+        payload (dict[str, Any]): request payload, with a "data" field
+
+    Returns:
+        bytes: JSON-encoded payload
+    """
+    if _rough_size(payload["data"]) > OFFLOAD_SERIALIZATION_THRESHOLD:
+        return await asyncio.to_thread(_json_dumps, payload)
+    return _json_dumps(payload)
+
 
 class Orchestrator:
     """Orchestrates bi-directional communication with containers
@@ -35,12 +101,19 @@ class Orchestrator:
         _manager (ContainerManager): container manager
         _store (DataStore): data store
         _host (str): host address
+        _session (Optional[ClientSession]): HTTP session shared across jobs
+        _service_resources_urls (Optional[list[tuple[str, str]]]): Cached
+            (container ID, service resources URL) pairs, built on first use
 
     Methods:
         process_chain_processor_job: Processes on-chain job from chain processor
         process_offchain_job: Processes off-chain job message
+        close: Closes shared HTTP session
 
     Private Methods:
+        _get_session: Returns shared HTTP session, (re)creating it if needed
+        _handle_container_failure: Fail job on container error
+        _run_single_container: Run a single-container job
         _run_job: Run a job
     """
 
@@ -61,6 +134,32 @@ class Orchestrator:
             else "localhost"
         )
 
+        # Shared HTTP session, keeps container connections alive across jobs
+        self._session: Optional[ClientSession] = None
+
+        # [(container ID, service resources URL)], container configs are fixed for
+        # the node's lifetime
+        self._service_resources_urls: Optional[list[tuple[str, str]]] = None
+
+    async def _get_session(self: Orchestrator) -> ClientSession:
+        """Returns shared HTTP session, creating it on first use or if closed
+
+        Returns:
+            ClientSession: shared HTTP session
+        """
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=0, force_close=False, enable_cleanup_closed=True
+                )
+            )
+        return self._session
+
+    async def close(self: Orchestrator) -> None:
+        """Closes shared HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+
     def _get_container_url(self: Orchestrator, container: str) -> str:
         """
         Get the service output URL for the specified container.
@@ -101,6 +200,119 @@ class Orchestrator:
             headers["Authorization"] = f"Bearer {bearer}"
         return headers
 
+    def _handle_container_failure(
+        self: Orchestrator,
+        job_id: Any,
+        container: str,
+        error: str,
+        results: list[ContainerResult],
+        message: Optional[OffchainJobMessage],
+    ) -> list[ContainerResult]:
+        """Fails job on container error. Appends container error to results, and
+        tracks job and container failure.
+
+        Args:
+            job_id (Any): job identifier
+            container (str): failed container
+            error (str): container error
+            results (list[ContainerResult]): job execution results so far
+            message (Optional[OffchainJobMessage]): optional offchain job message to
+                track state in store
+
+        Returns:
+            list[ContainerResult]: job execution results, including container error
+        """
+
+        # Fail job
+        results.append(ContainerError(container, error))
+        log.error(
+            "Container error",
+            id=job_id,
+            container=container,
+            error=error,
+        )
+
+        # Track job failure
+        self._store.set_failed(message, results)
+
+        # Track container failure
+        self._store.track_container_status(
+            container,
+            "failed",
+        )
+
+        return results
+
+    async def _run_single_container(
+        self: Orchestrator,
+        job_id: Any,
+        job_input: JobInput,
+        container: str,
+        message: Optional[OffchainJobMessage],
+        requires_proof: Optional[bool],
+    ) -> list[ContainerResult]:
+        """Runs a single-container job
+
+        Specialization of `_run_job` for jobs with exactly one container, where the
+        container's destination is the job's destination. Stores job status and
+        results.
+
+        Args:
+            job_id (Any): job identifier
+            job_input (JobInput): input to container
+            container (str): container to execute
+            message (Optional[OffchainJobMessage]): optional offchain job message to
+                track state in store
+            requires_proof (bool): whether job requires proof
+
+        Returns:
+            list[ContainerResult]: job execution results
+        """
+        results: list[ContainerResult] = []
+        session = await self._get_session()
+        try:
+            async with session.post(
+                self._get_container_url(container),
+                data=await _serialize(
+                    {
+                        "source": job_input.source,
+                        "destination": job_input.destination,
+                        "data": job_input.data,
+                        "requires_proof": bool(requires_proof),
+                    }
+                ),
+                headers=self._get_headers(container),
+                timeout=ClientTimeout(total=180),
+            ) as response:
+                # Read body once, while response is still open
+                raw = await response.read()
+
+            # Handle JSON response
+            results.append(ContainerOutput(container, json.loads(raw)))
+
+        except json.JSONDecodeError:
+            # Handle non-JSON response as error
+            response_text = raw.decode("utf-8", "replace")
+            return self._handle_container_failure(
+                job_id, container, response_text, results, message
+            )
+
+        except Exception as e:
+            return self._handle_container_failure(
+                job_id, container, str(e), results, message
+            )
+
+        # Track container success
+        self._store.track_container_status(
+            container,
+            "success",
+        )
+
+        # Track job success
+        self._store.set_success(message, results)
+
+        return results
+
     async def _run_job(
         self: Orchestrator,
         job_id: Any,
@@ -131,105 +343,85 @@ class Orchestrator:
         # Start job
         self._store.set_running(message)
 
+        # Single container jobs (the common case) skip chaining bookkeeping
+        if len(containers) == 1:
+            return await self._run_single_container(
+                job_id, job_input, containers[0], message, requires_proof
+            )
+
         # Setup input and results
         results: list[ContainerResult] = []
 
-        # If only one container, destination of first container is destination of job
-        # Otherwise, destination of first container is off-chain, and source of next
-        # container is off-chain (i.e. chaining containers together)
+        # Destination of first container is off-chain, and source of next container
+        # is off-chain (i.e. chaining containers together)
         input_data = ContainerInput(
             source=job_input.source,
-            destination=(
-                job_input.destination
-                if len(containers) == 1
-                else JobLocation.OFFCHAIN.value
-            ),
+            destination=JobLocation.OFFCHAIN.value,
             data=job_input.data,
             requires_proof=bool(requires_proof),
         )
 
+        # Get container URLs and headers once, ahead of the container chain
+        urls = [self._get_container_url(container) for container in containers]
+        headers_list = [self._get_headers(container) for container in containers]
+
         # Call container chain
-        async with ClientSession() as session:
-            for index, container in enumerate(containers):
-                # Get container port and URL
-                url = self._get_container_url(container)
-                headers = self._get_headers(container)
-                try:
-                    async with session.post(
-                        url,
-                        json=asdict(input_data),
-                        headers=headers,
-                        timeout=ClientTimeout(total=180),
-                    ) as response:
+        session = await self._get_session()
+        for index, container in enumerate(containers):
+            url = urls[index]
+            headers = headers_list[index]
+            try:
+                async with session.post(
+                    url,
+                    data=await _serialize(
+                        {
+                            "source": input_data.source,
+                            "destination": input_data.destination,
+                            "data": input_data.data,
+                            "requires_proof": input_data.requires_proof,
+                        }
+                    ),
+                    headers=headers,
+                    timeout=ClientTimeout(total=180),
+                ) as response:
+                    # Read body once, while response is still open
+                    raw = await response.read()
 
-                        # Handle JSON response
-                        output = await response.json()
-                        results.append(ContainerOutput(container, output))
-
-                        # Track container success
-                        self._store.track_container_status(
-                            container,
-                            "success",
-                        )
-
-                        # If next container is the last container, set destination to
-                        # job destination. Otherwise, set destination to off-chain
-                        # (i.e. chaining containers together)
-                        input_data = ContainerInput(
-                            source=JobLocation.OFFCHAIN.value,
-                            destination=(
-                                job_input.destination
-                                if index == len(containers) - 2
-                                else JobLocation.OFFCHAIN.value
-                            ),
-                            data=output,
-                            requires_proof=bool(requires_proof),
-                        )
-
-                except JSONDecodeError:
-                    # Handle non-JSON response as error
-                    response_text = await response.text()
-
-                    # Fail job
-                    results.append(ContainerError(container, response_text))
-                    log.error(
-                        "Container error",
-                        id=job_id,
-                        container=container,
-                        error=response_text,
-                    )
-
-                    # Track job failure
-                    self._store.set_failed(message, results)
-
-                    # Track container failure
-                    self._store.track_container_status(
-                        container,
-                        "failed",
-                    )
-
-                    return results
+                # Handle JSON response
+                output = json.loads(raw)
+                results.append(ContainerOutput(container, output))
 
-                except Exception as e:
-                    # Fail job
-                    results.append(ContainerError(container, str(e)))
-                    log.error(
-                        "Container error",
-                        id=job_id,
-                        container=container,
-                        error=str(e),
-                    )
-
-                    # Track job failure
-                    self._store.set_failed(message, results)
-
-                    # Track container failure
-                    self._store.track_container_status(
-                        container,
-                        "failed",
-                    )
-
-                    return results
+                # Track container success
+                self._store.track_container_status(
+                    container,
+                    "success",
+                )
+
+                # If next container is the last container, set destination to
+                # job destination. Otherwise, set destination to off-chain
+                # (i.e. chaining containers together)
+                input_data = ContainerInput(
+                    source=JobLocation.OFFCHAIN.value,
+                    destination=(
+                        job_input.destination
+                        if index == len(containers) - 2
+                        else JobLocation.OFFCHAIN.value
+                    ),
+                    data=output,
+                    requires_proof=bool(requires_proof),
+                )
+
+            except json.JSONDecodeError:
+                # Handle non-JSON response as error
+                response_text = raw.decode("utf-8", "replace")
+                return self._handle_container_failure(
+                    job_id, container, response_text, results, message
+                )
+
+            except Exception as e:
+                return self._handle_container_failure(
+                    job_id, container, str(e), results, message
+                )
 
         # Track job success
         self._store.set_success(message, results)
@@ -313,55 +505,61 @@ class Orchestrator:
         # Start job and track container
         self._store.set_running(message)
 
-        # Hold chunks in memory to store final results in Redis
-        chunks = []
+        # Accumulate chunks in memory to store final results in Redis
+        buffer = bytearray()
 
-        async with ClientSession() as session:
-            try:
-                job_input = JobInput(
-                    source=JobLocation.OFFCHAIN.value,
-                    destination=JobLocation.STREAM.value,
-                    data=message.data,
-                )
-
-                async with session.post(
-                    url,
-                    json=asdict(job_input),
-                    headers=headers,
-                    timeout=ClientTimeout(total=60),
-                ) as response:
-                    # Raises exception if status code is not 200
-                    response.raise_for_status()
-
-                    async for chunk in response.content.iter_any():
-                        chunks.append(chunk)
-                        yield chunk
-
-                # Track job success
-                final_result = b"".join(chunks).decode("utf-8")
-                self._store.set_success(
-                    message,
-                    [ContainerOutput(container, dict({"output": final_result}))],
-                )
-
-                # Track container success
-                self._store.track_container_status(
-                    container,
-                    "success",
-                )
-
-            except Exception as e:
-                # Track job failure
-                log.error(
-                    "Container error", id=message.id, container=container, error=str(e)
-                )
-                self._store.set_failed(message, [ContainerError(container, str(e))])
-
-                # Track container failure
-                self._store.track_container_status(
-                    container,
-                    "failed",
-                )
+        session = await self._get_session()
+        try:
+            job_input = JobInput(
+                source=JobLocation.OFFCHAIN.value,
+                destination=JobLocation.STREAM.value,
+                data=message.data,
+            )
+
+            async with session.post(
+                url,
+                data=await _serialize(
+                    {
+                        "source": job_input.source,
+                        "destination": job_input.destination,
+                        "data": job_input.data,
+                    }
+                ),
+                headers=headers,
+                timeout=ClientTimeout(total=60),
+            ) as response:
+                # Raises exception if status code is not 200
+                response.raise_for_status()
+
+                async for chunk in response.content.iter_any():
+                    buffer.extend(chunk)
+                    yield chunk
+
+            # Track job success
+            final_result = buffer.decode("utf-8")
+            self._store.set_success(
+                message,
+                [ContainerOutput(container, dict({"output": final_result}))],
+            )
+
+            # Track container success
+            self._store.track_container_status(
+                container,
+                "success",
+            )
+
+        except Exception as e:
+            # Track job failure
+            log.error(
+                "Container error", id=message.id, container=container, error=str(e)
+            )
+            self._store.set_failed(message, [ContainerError(container, str(e))])
+
+            # Track container failure
+            self._store.track_container_status(
+                container,
+                "failed",
+            )
 
     async def collect_service_resources(
         self: Orchestrator, model_id: Optional[str]
@@ -378,37 +576,55 @@ class Orchestrator:
             dict[str, Any]: Mapping from container ID to service resources
         """
 
+        # Bound number of concurrent requests to containers
+        semaphore = asyncio.Semaphore(SERVICE_RESOURCES_MAX_CONCURRENCY)
+
         async def fetch(session: ClientSession, url: str) -> Optional[dict[str, Any]]:
-            """Async fetch data from a URL. Return None if there's an exception."""
-            try:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    return cast(dict[str, Any], await response.json())
-            except Exception as e:
-                log.warning(f"Error fetching data from {url}: {e}")
-                return None
-
-        async with ClientSession() as session:
-            tasks = {
-                container.id: fetch(
-                    session,
-                    (
-                        # If model ID specified, check which containers serve the model
-                        # Otherwise, fetch all resources from each container
-                        f"http://{self._host}:{container.port}/service-resources?model_id={model_id}"
-                        if model_id
-                        else f"http://{self._host}:{container.port}/service-resources"
-                    ),
+            """Async fetch data from a URL. Return None if there's an exception
+            (including timeouts)."""
+            async with semaphore:
+                try:
+                    async with session.get(
+                        url, timeout=ClientTimeout(total=SERVICE_RESOURCES_TIMEOUT)
+                    ) as response:
+                        response.raise_for_status()
+                        return cast(dict[str, Any], await response.json())
+                except Exception as e:
+                    log.warning(f"Error fetching data from {url}: {e}")
+                    return None
+
+        # Build per-container service resources URLs once
+        urls = self._service_resources_urls
+        if urls is None:
+            urls = self._service_resources_urls = [
+                (
+                    container.id,
+                    f"http://{self._host}:{container.port}/service-resources",
                 )
-                for container in self._manager._configs
-            }
-
-            # Gather results in parallel
-            results = await asyncio.gather(*tasks.values(), return_exceptions=False)
-
-            # Return a dictionary from container id to fetch result
-            return {
-                container_id: result
-                for container_id, result in zip(tasks.keys(), results)
-                if result is not None
-            }
+                for container in self._manager.configs
+            ]
+
+        session = await self._get_session()
+        tasks = {
+            container_id: fetch(
+                session,
+                (
+                    # If model ID specified, check which containers serve the model
+                    # Otherwise, fetch all resources from each container
+                    f"{url}?model_id={model_id}"
+                    if model_id
+                    else url
+                ),
+            )
+            for container_id, url in urls
+        }
+
+        # Gather results in parallel
+        results = await asyncio.gather(*tasks.values(), return_exceptions=False)
+
+        # Return a dictionary from container id to fetch result
+        return {
+            container_id: result
+            for container_id, result in zip(tasks.keys(), results)
+            if result is not None
+        }
@@ -20,10 +20,12 @@ from json import dumps, loads
 from typing import Optional
 
 import redis
+import structlog
 
 from shared import ContainerResult, JobResult, JobStatus
 from shared.message import BaseMessage, OffchainMessage
-from utils import log
+
+log = structlog.get_logger(__name__)
 
 # Loose expiration time for pending jobs
 PENDING_JOB_TTL = 15  # minutes
@@ -6,6 +6,7 @@ from functools import wraps
 from typing import Any, Optional, Tuple, Union, cast
 from uuid import uuid4
 
+import structlog
 from hypercorn.asyncio import serve
 from hypercorn.config import Config
 from quart import Quart, Response, jsonify, request
@@ -24,9 +25,10 @@ from shared.message import (
     OffchainJobMessage,
     OffchainMessage,
 )
-from utils import log
 from utils.parser import from_union
 
+log = structlog.get_logger(__name__)
+
 
 class RESTServer(AsyncTask):
     """A REST webserver that processes off-chain requests.
@@ -5,12 +5,14 @@ import time
 from typing import Any, Optional
 from uuid import uuid4
 
+import structlog
 from fluent import sender  # type: ignore
 
 from chain.wallet import Wallet
 from orchestration import DataStore, Guardian
 from shared.service import AsyncTask
-from utils.logging import log
+
+log = structlog.get_logger(__name__)
 
 # Constants - intervals in seconds for forwarding stats to Ritual
 LIVE_INTERVAL = 60
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import json
-from typing import Any, List, Optional
+from typing import Any, List, Literal, Optional
 
 import structlog
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, PositiveInt, model_validator
 
 log = structlog.get_logger(__name__)
 
@@ -39,6 +39,7 @@ class ConfigSnapshotSync(BaseModel):
     batch_size: int = 500
     starting_sub_id: int = 0
     sync_period: float = 0.5
+    concurrency: PositiveInt = 2
 
 
 class ConfigChain(BaseModel):
@@ -105,12 +106,18 @@ class ConfigRedis(BaseModel):
     port: int = 6379
 
 
+# Log level names accepted in config[log]
+LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+
 class ConfigLog(BaseModel):
     """Expected config[log] format"""
 
     path: str = "infernet_node.log"
     max_file_size: int = 2**30  # 1GB
     backup_count: int = 2
+    file_level: LogLevel = "DEBUG"
+    console_level: LogLevel = "INFO"
 
 
 class Config(BaseModel):
@@ -3,7 +3,7 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass
 from functools import cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import structlog
 from eth_account.messages import SignableMessage, encode_typed_data
@@ -16,7 +16,7 @@ from web3.constants import ADDRESS_ZERO
 if TYPE_CHECKING:
     from chain.container_lookup import ContainerLookup
 
-log = structlog.get_logger()
+log = structlog.get_logger(__name__)
 
 UINT32_MAX = 2**32 - 1
 
@@ -47,6 +47,7 @@ class Subscription:
         get_delegate_subscription_typed_data: Generates EIP-712 DelegateeSubscription
             data
         get_tx_inputs: Returns subscription parameters in tx array format
+        from_reader_tuples: Builds subscriptions in bulk from raw Reader rows
 
     Public attributes:
         id (int): Subscription ID (-1 if delegated subscription)
@@ -73,6 +74,24 @@ class Subscription:
 
     """
 
+    __slots__ = (
+        "id",
+        "_container_lookup",
+        "_owner",
+        "_active_at",
+        "_period",
+        "_frequency",
+        "_redundancy",
+        "_containers_hash",
+        "_lazy",
+        "_verifier",
+        "_payment_amount",
+        "_payment_token",
+        "_wallet",
+        "_responses",
+        "_node_replied",
+    )
+
     def __init__(
         self: Subscription,
         id: int,
@@ -125,6 +144,48 @@ class Subscription:
         self._responses: dict[int, int] = {}
         self._node_replied: dict[int, bool] = {}
 
+    @classmethod
+    def from_reader_tuples(
+        cls: type[Subscription],
+        start_id: int,
+        container_lookup: ContainerLookup,
+        rows: list[tuple[Any, ...]],
+    ) -> list[Subscription]:
+        """Builds subscriptions in bulk from raw Reader `readSubscriptionBatch` rows,
+        assigning attributes directly instead of going through `__init__`
+
+        Args:
+            start_id (int): Subscription ID of first row, IDs are consecutive
+            container_lookup (ContainerLookup): Container lookup instance
+            rows (list[tuple[Any, ...]]): raw subscription tuples, in the same order
+                as `__init__` parameters (owner ... wallet)
+
+        Returns:
+            list[Subscription]: subscriptions
+        """
+        subscriptions = []
+        for subscription_id, row in enumerate(rows, start_id):
+            sub = cls.__new__(cls)
+            sub.id = subscription_id
+            sub._container_lookup = container_lookup
+            (
+                sub._owner,
+                sub._active_at,
+                sub._period,
+                sub._frequency,
+                sub._redundancy,
+                sub._containers_hash,
+                sub._lazy,
+                sub._verifier,
+                sub._payment_amount,
+                sub._payment_token,
+                sub._wallet,
+            ) = row
+            sub._responses = {}
+            sub._node_replied = {}
+            subscriptions.append(sub)
+        return subscriptions
+
     @property
     def active(self: Subscription) -> bool:
         """Returns whether a subscription is active (current time > active_at)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import structlog
+
 from shared.config import InfernetContainer
-from utils.logging import log
+
+log = structlog.get_logger(__name__)
 
 
 def assign_ports(configs: list[InfernetContainer]) -> list[InfernetContainer]:
@@ -1,25 +1,285 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import io
+import json
 import logging
-from logging.handlers import RotatingFileHandler
-from typing import Literal
+import os
+import queue
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Literal, Optional, cast
 
-import pyfiglet  # type: ignore
+import orjson
 import structlog
-from rich import print
 
 from shared.config import ConfigLog
 
-# Re-export logger
-log = structlog.get_logger()
+# Re-export logger. Resolves the stdlib logger (named after the calling module) on
+# every call, so it is exempt from caching on first use. Modules that log on hot paths
+# use their own `structlog.get_logger(__name__)`, which is cached
+log = structlog.wrap_logger(None, cache_logger_on_first_use=False)
+
+# Timestamp format of log records
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Per-thread cache of the last formatted (second-resolution) timestamp
+_timestamp_cache = threading.local()
+
+
+def add_timestamp(
+    logger: structlog.typing.WrappedLogger,
+    name: str,
+    event_dict: structlog.typing.EventDict,
+) -> structlog.typing.EventDict:
+    """Adds local timestamp to event dict. Replaces `structlog.processors.TimeStamper`,
+    re-formatting the timestamp at most once per second (per thread).
+    """
+
+    sec = int(time.time())
+    if getattr(_timestamp_cache, "sec", None) != sec:
+        _timestamp_cache.sec = sec
+        _timestamp_cache.formatted = time.strftime(TIMESTAMP_FORMAT, time.localtime(sec))
+    event_dict["timestamp"] = _timestamp_cache.formatted
+    return event_dict
+
+
+def merge_contextvars(
+    logger: structlog.typing.WrappedLogger,
+    name: str,
+    event_dict: structlog.typing.EventDict,
+) -> structlog.typing.EventDict:
+    """Merges global (context-local) context into event dict, in place. Replaces
+    `structlog.contextvars.merge_contextvars`, looking up only the context variables
+    bound through structlog instead of scanning every variable of the current
+    context (e.g. those of asyncio, aiohttp, web3).
+    """
+
+    # Snapshot, variables may be registered concurrently by other threads
+    for key, var in tuple(structlog.contextvars._CONTEXT_VARS.items()):
+        value = var.get()
+        if value is not Ellipsis:
+            event_dict.setdefault(
+                key[structlog.contextvars.STRUCTLOG_KEY_PREFIX_LEN :], value
+            )
+    return event_dict
+
 
 # Structlog shared processors
-SHARED_PROCESSORS: list[structlog.typing.Processor] = [
-    structlog.contextvars.merge_contextvars,  # Merge in global context
+SHARED_PROCESSORS: tuple[structlog.typing.Processor, ...] = (
+    merge_contextvars,  # Merge in global context
     structlog.stdlib.add_log_level,  # Add log level
     structlog.stdlib.add_logger_name,  # Add logging function
-    structlog.dev.set_exc_info,  # Exception info handling
-    structlog.processors.TimeStamper("%Y-%m-%d %H:%M:%S", utc=False),  # Timestamp
+    add_timestamp,  # Timestamp
     structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-]
+)
+
+
+class OrjsonFormatter(logging.Formatter):
+    """Formats records as newline-terminated JSON bytes using orjson, for handlers
+    writing bytes (skips the str round-trip of `ProcessorFormatter`). Non-serializable
+    values are rendered with `str()`, exceptions as traceback strings.
+
+    Structlog records (see `ProcessorFormatter.wrap_for_formatter`) are rendered from
+    their event dict, other records from their message.
+
+    Public methods:
+        format_bytes: Formats record as newline-terminated JSON bytes
+    """
+
+    def format_bytes(self: OrjsonFormatter, record: logging.LogRecord) -> bytes:
+        """Formats record as newline-terminated JSON bytes
+
+        Args:
+            record (logging.LogRecord): Record to format
+
+        Returns:
+            bytes: Encoded JSON line
+        """
+        event_dict: structlog.typing.EventDict
+        if isinstance(record.msg, dict):
+            event_dict = record.msg
+        else:
+            event_dict = {"event": record.getMessage()}
+            if record.exc_info:
+                event_dict["exc_info"] = record.exc_info
+
+        if "exc_info" in event_dict:
+            # Copy, as record may be shared with other handlers
+            event_dict = structlog.processors.format_exc_info(None, "", dict(event_dict))
+
+        try:
+            return orjson.dumps(
+                event_dict,
+                default=str,
+                option=orjson.OPT_UTC_Z
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_APPEND_NEWLINE,
+            )
+        except orjson.JSONEncodeError:
+            # orjson rejects integers larger than 64 bits (e.g. uint256 balances)
+            return (json.dumps(event_dict, default=str) + "\n").encode()
+
+    def format(self: OrjsonFormatter, record: logging.LogRecord) -> str:
+        return self.format_bytes(record)[:-1].decode()
+
+
+class StructlogQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records unformatted. The default `prepare()`
+    formats records on the caller's thread and flattens `record.msg` to a string,
+    which breaks `structlog.stdlib.ProcessorFormatter` (expects the event dict) and
+    defeats the purpose of offloading formatting to the listener thread.
+    """
+
+    def prepare(
+        self: StructlogQueueHandler, record: logging.LogRecord
+    ) -> logging.LogRecord:
+        # `exc_info=True` is resolved via sys.exc_info() at render time, which is
+        # empty on the listener thread. Capture the exception on the caller's thread
+        event_dict = record.msg
+        if isinstance(event_dict, dict) and event_dict.get("exc_info") is True:
+            event_dict["exc_info"] = sys.exc_info()
+        return record
+
+
+class FdStreamHandler(logging.Handler):
+    """Writes encoded records straight to a file descriptor with os.write(),
+    bypassing the TextIOWrapper (and its lock and encoder) of `sys.stderr`.
+
+    Private attributes:
+        _fd (int): File descriptor to write records to
+    """
+
+    def __init__(self: FdStreamHandler, fd: int) -> None:
+        """Initializes new FdStreamHandler
+
+        Args:
+            fd (int): File descriptor to write records to
+        """
+        super().__init__()
+        self._fd = fd
+
+    def emit(self: FdStreamHandler, record: logging.LogRecord) -> None:
+        try:
+            data = memoryview(self.format(record).encode("utf-8", "replace") + b"\n")
+            # os.write() may write partially (e.g. to a full pipe)
+            while data:
+                data = data[os.write(self._fd, data) :]
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Log file write buffer size, in bytes
+FILE_BUFFER_SIZE = 65536
+
+# Interval at which buffered log file writes are flushed, in seconds
+FILE_FLUSH_INTERVAL = 0.5
+
+# Number of records after which the tracked log file size is re-synced with the
+# actual file position, correcting drift (e.g. from external writes or truncation)
+FILE_SIZE_SYNC_INTERVAL = 1024
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that batches writes through a large file buffer, instead
+    of flushing (one write() syscall) per record. The file is opened in binary mode:
+    records formatted by an `OrjsonFormatter` are written as bytes as-is, others are
+    encoded.
+
+    Buffered records are flushed on WARNING+ records, on rollover, on close, and
+    every FILE_FLUSH_INTERVAL seconds by a background thread. Rollover is decided on
+    a file size tracked in memory (instead of seeking the stream and formatting each
+    record twice), re-synced with `tell()` every FILE_SIZE_SYNC_INTERVAL records.
+
+    Private attributes:
+        _size (int): Current size of the log file, in bytes
+        _unsynced (int): Records written since `_size` was last synced
+        _codec (str): Codec records not formatted by an `OrjsonFormatter` are
+            encoded with
+        _stop_flushing (threading.Event): Set on close, stops periodic flushing
+        _flusher (threading.Thread): Periodic flush thread
+    """
+
+    def __init__(self: BufferedRotatingFileHandler, *args: Any, **kwargs: Any) -> None:
+        self._size = 0
+        self._unsynced = 0
+        super().__init__(*args, **kwargs)
+        # FileHandler defaults `encoding` to "locale", which open() accepts but
+        # str.encode() does not. Default to UTF-8, as written by `OrjsonFormatter`
+        if self.encoding is None or self.encoding == "locale":
+            self._codec = "utf-8"
+        else:
+            self._codec = self.encoding
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="log-file-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def _open(  # type: ignore[override]
+        self: BufferedRotatingFileHandler,
+    ) -> io.BufferedWriter:
+        stream = cast(
+            io.BufferedWriter,
+            open(self.baseFilename, self.mode + "b", buffering=FILE_BUFFER_SIZE),
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        self._unsynced = 0
+        return stream
+
+    def _flush_periodically(self: BufferedRotatingFileHandler) -> None:
+        while not self._stop_flushing.wait(FILE_FLUSH_INTERVAL):
+            self.flush()
+
+    def emit(self: BufferedRotatingFileHandler, record: logging.LogRecord) -> None:
+        try:
+            if isinstance(self.formatter, OrjsonFormatter):
+                data = self.formatter.format_bytes(record)
+            else:
+                data = (self.format(record) + self.terminator).encode(
+                    self._codec, self.errors or "strict"
+                )
+            if self.maxBytes > 0 and self._size + len(data) >= self.maxBytes:
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()  # type: ignore[assignment]
+            stream = cast(io.BufferedWriter, self.stream)
+            stream.write(data)
+            self._size += len(data)
+            self._unsynced += 1
+            if self._unsynced >= FILE_SIZE_SYNC_INTERVAL:
+                self._size = stream.tell()
+                self._unsynced = 0
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self: BufferedRotatingFileHandler) -> None:
+        self._stop_flushing.set()
+        super().close()
+
+
+# Log formatters, built once and shared by handlers across setup_logging() calls
+_CONSOLE_FORMATTER = structlog.stdlib.ProcessorFormatter(
+    # Print to console, pad all events w/ min. 50 spaces (only if a terminal, for
+    # alignment), don't sort keys
+    processor=structlog.dev.ConsoleRenderer(
+        pad_event=50 if sys.stderr and sys.stderr.isatty() else 0,
+        sort_keys=False,
+    )
+)
+_FILE_FORMATTER = OrjsonFormatter()  # Format logs as JSON
+
+# Listener thread running the console and file handlers, set by setup_logging()
+_queue_listener: Optional[QueueListener] = None
 
 # Font for ASCII art, taken from http://www.figlet.org/examples.html
 PIGLET_FONT = "o8"
@@ -32,51 +292,102 @@ def setup_logging(config: ConfigLog) -> None:
         config (ConfigLog): Logging configuration options
     """
 
-    # Configure structlog
-    # Largely standard config: https://www.structlog.org/en/stable/configuration.html
-    structlog.configure(
-        processors=SHARED_PROCESSORS,
-        context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
-    )
-
     # Setup raw python logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.NOTSET)
 
     # Setup log handlers
-    console_handler = logging.StreamHandler()  # Stream to sys.stderr
+    console_handler: logging.Handler
+    try:
+        # Write to sys.stderr's file descriptor directly
+        sys.stderr.flush()
+        console_handler = FdStreamHandler(sys.stderr.fileno())
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        # sys.stderr is replaced or has no file descriptor
+        console_handler = logging.StreamHandler()  # Stream to sys.stderr
 
     # Use RotatingFileHandler to limit log file size
-    file_handler = RotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         config.path,
         maxBytes=config.max_file_size,
         backupCount=config.backup_count,
     )
 
     # Setup log formatting
-    console_handler.setFormatter(
-        structlog.stdlib.ProcessorFormatter(
-            # Print to console, pad all events w/ min. 50 spaces, don't sort keys
-            processor=structlog.dev.ConsoleRenderer(pad_event=50, sort_keys=False)
-        )
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
+    console_handler.setLevel(config.console_level)
+    file_handler.setFormatter(_FILE_FORMATTER)
+    file_handler.setLevel(config.file_level)
+
+    # Configure structlog
+    # Largely standard config: https://www.structlog.org/en/stable/configuration.html
+    # Calls below every handler's level return before running any processors
+    structlog.configure(
+        processors=SHARED_PROCESSORS,
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.make_filtering_bound_logger(
+            min(console_handler.level, file_handler.level)
+        ),
+        # Assemble module-level loggers once, on first use
+        cache_logger_on_first_use=True,
     )
-    console_handler.setLevel(logging.INFO)  # Console INFO+
-    file_handler.setFormatter(
-        structlog.stdlib.ProcessorFormatter(
-            # Format logs as JSON
-            processor=structlog.processors.JSONRenderer()
-        )
+
+    # Run handlers on a listener thread, so logging callers only enqueue records
+    # instead of blocking on console / file I/O
+    global _queue_listener
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger.addHandler(StructlogQueueHandler(log_queue))
+    _queue_listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
     )
-    file_handler.setLevel(logging.DEBUG)  # Save to file DEBUG+
+    _queue_listener.start()
+
+    # Drain queued records on interpreter exit
+    atexit.register(_queue_listener.stop)
+
+
+@functools.cache
+def _ritual_label() -> str:
+    """Renders RITUAL ASCII art label. Imports pyfiglet (which loads its fonts from
+    disk) on first use, rather than when this module is imported.
+
+    Returns:
+        str: ASCII art label
+    """
+    import pyfiglet  # type: ignore
+
+    return cast(str, pyfiglet.figlet_format("RITUAL", font=PIGLET_FONT))
+
 
-    # Add log handlers to raw python logger
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+# Status labels and ANSI styles (bold, colored) of status banners, by status
+_BANNER_STYLES: dict[str, tuple[str, bytes]] = {
+    "success": ("SUCCESS", b"\x1b[1;32m"),
+    "failure": ("FAILURE", b"\x1b[1;31m"),
+    "warning": ("WARNING", b"\x1b[1;33m"),
+}
+_ANSI_RESET = b"\x1b[0m"
 
 
-RITUAL_LABEL = pyfiglet.figlet_format("RITUAL", font=PIGLET_FONT)
+@functools.cache
+def _status_banner(status: str) -> bytes:
+    """Builds encoded status banner, prepended to status messages. Colorized with
+    ANSI escape codes only if stdout is a terminal.
+
+    Args:
+        status (str): Status of message
+
+    Returns:
+        bytes: Colorized ASCII art label and status line
+    """
+    label, style = _BANNER_STYLES[status]
+    reset = _ANSI_RESET
+    if not sys.stdout.isatty():
+        style = reset = b""
+    return (
+        b"\n" + style + _ritual_label().encode() + reset + b"\n"
+        b"Status: " + style + label.encode() + reset + b" "
+    )
 
 
 def log_ascii_status(
@@ -89,22 +400,14 @@ def log_ascii_status(
         status (Literal["success", "failure", "warning"]): Status of message
     """
 
-    def _colorize(text: str, color: str) -> str:
-        return f"[{color}]{text}[/{color}]"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # sys.stdout is replaced or wrapped, write text instead
+        sys.stdout.write(_status_banner(status).decode() + message + "\n")
+        sys.stdout.flush()
+        return
 
-    match status:
-        case "success":
-            print(
-                f"\n{_colorize(RITUAL_LABEL, 'bold green')}\n"
-                f"Status: {_colorize('SUCCESS', 'bold green')} " + message
-            )
-        case "failure":
-            print(
-                f"\n{_colorize(RITUAL_LABEL, 'bold red')}\n"
-                f"Status: {_colorize('FAILURE', 'bold red')} " + message
-            )
-        case "warning":
-            print(
-                f"\n{_colorize(RITUAL_LABEL, 'bold yellow')}\n"
-                f"Status: {_colorize('WARNING', 'bold yellow')} " + message
-            )
+    # Keep ordering with text already written to sys.stdout
+    sys.stdout.flush()
+    buffer.write(_status_banner(status) + message.encode("utf-8", "replace") + b"\n")
+    buffer.flush()
@@ -4,10 +4,12 @@ __version__ = "1.4.0"
 import re
 
 import requests
+import structlog
 
-from utils import log
 from utils.logging import log_ascii_status
 
+log = structlog.get_logger(__name__)
+
 
 def check_node_is_up_to_date() -> None:
     """Check if the node version is up to date with the latest release on GitHub"""